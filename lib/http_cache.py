@@ -0,0 +1,145 @@
+"""Small disk-backed cache for HTTP responses.
+
+Lets the scrapers skip re-fetching identical requests across repeated
+runs (common during development). Entries are keyed by method + URL +
+request body and stored as raw response bytes; freshness is judged from
+the entry file's mtime against the caller's TTL.
+
+Caching is off until configure() is called with a directory, so library
+users (e.g. the Streamlit app, which has its own cache layer) are
+unaffected unless they opt in. Stdlib-only on purpose — the project does
+not carry a cache dependency.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+DEFAULT_TTL = 3600.0
+# Search/list endpoints change as inventory moves; per-record detail
+# endpoints are far more static, so they get a week.
+LIST_TTL = 24 * 3600.0
+DETAIL_TTL = 7 * 24 * 3600.0
+
+_cache_dir: Path | None = None
+
+
+def default_dir() -> Path:
+    """Default cache location, overridable via AZIZ_CACHE_DIR."""
+    return Path(os.environ.get("AZIZ_CACHE_DIR", str(Path.home() / ".cache" / "aziz")))
+
+
+def configure(cache_dir: os.PathLike | str | None) -> None:
+    """Enable caching under cache_dir, or disable it by passing None."""
+    global _cache_dir
+    _cache_dir = Path(cache_dir) if cache_dir else None
+
+
+def enabled() -> bool:
+    return _cache_dir is not None
+
+
+def _entry_path(method: str, url: str, body: Any) -> Path:
+    h = hashlib.blake2b(digest_size=20)
+    h.update(method.encode())
+    h.update(b"|")
+    h.update(url.encode())
+    h.update(b"|")
+    if body:
+        h.update(body if isinstance(body, bytes) else str(body).encode())
+    assert _cache_dir is not None
+    return _cache_dir / f"{h.hexdigest()}.bin"
+
+
+def get(method: str, url: str, body: Any = None, ttl: float = DEFAULT_TTL) -> bytes | None:
+    """Return the cached response body, or None on miss/expiry/disabled."""
+    if _cache_dir is None:
+        return None
+    path = _entry_path(method, url, body)
+    try:
+        if time.time() - path.stat().st_mtime < ttl:
+            return path.read_bytes()
+    except OSError:
+        pass
+    return None
+
+
+def get_stale(method: str, url: str, body: Any = None) -> bytes | None:
+    """Cached body regardless of age — for replay after a 304 Not Modified."""
+    if _cache_dir is None:
+        return None
+    try:
+        return _entry_path(method, url, body).read_bytes()
+    except OSError:
+        return None
+
+
+def validators(method: str, url: str, body: Any = None) -> dict:
+    """Conditional-request headers for a cached entry.
+
+    Returns If-None-Match / If-Modified-Since built from the validators
+    stored alongside the body, or an empty dict when there are none.
+    """
+    if _cache_dir is None:
+        return {}
+    try:
+        meta = json.loads(_meta_path(method, url, body).read_text())
+    except (OSError, ValueError):
+        return {}
+    out = {}
+    if meta.get("etag"):
+        out["If-None-Match"] = meta["etag"]
+    if meta.get("last_modified"):
+        out["If-Modified-Since"] = meta["last_modified"]
+    return out
+
+
+def freshen(method: str, url: str, body: Any = None) -> None:
+    """Reset an entry's age after the server confirmed it unchanged."""
+    if _cache_dir is None:
+        return
+    try:
+        os.utime(_entry_path(method, url, body))
+    except OSError:
+        pass
+
+
+def _meta_path(method: str, url: str, body: Any) -> Path:
+    return _entry_path(method, url, body).with_suffix(".meta")
+
+
+def put(
+    method: str,
+    url: str,
+    body: Any = None,
+    content: bytes = b"",
+    etag: str | None = None,
+    last_modified: str | None = None,
+) -> None:
+    """Store a response body; silently a no-op when caching is disabled.
+
+    When the response carried ETag/Last-Modified headers, they are kept
+    in a small sidecar file so a later expired entry can be revalidated
+    with a conditional request instead of re-downloaded.
+    """
+    if _cache_dir is None:
+        return
+    try:
+        _cache_dir.mkdir(parents=True, exist_ok=True)
+        _entry_path(method, url, body).write_bytes(content)
+        if etag or last_modified:
+            _meta_path(method, url, body).write_text(
+                json.dumps({"etag": etag, "last_modified": last_modified})
+            )
+        else:
+            # Drop any sidecar from a previous response — stale
+            # validators here would let a later 304 freshen a body
+            # they never described
+            _meta_path(method, url, body).unlink(missing_ok=True)
+    except OSError:
+        pass
@@ -1,24 +1,39 @@
 import json
 import os
 import re
+from collections import deque
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+
+def json_loads(data: bytes | str) -> Any:
+    """Parse JSON from bytes or str, preferring orjson when installed.
+
+    orjson takes bytes directly, so callers holding a raw response body
+    skip the intermediate UTF-8 str decode entirely.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 _NON_ALNUM = re.compile(r"[^0-9A-Za-z]+")
 _CAMEL_SPLIT = re.compile(r"([a-z0-9])([A-Z])")
 
 
-def to_camel_case(key: Any) -> Any:
-    """Normalize arbitrary keys to lowerCamelCase without underscores/spaces.
+@lru_cache(maxsize=4096)
+def _camel_str(key: str) -> str:
+    """Do the actual string conversion for to_camel_case (cached).
 
-    - Removes trailing Salesforce suffix "__c" if present
-    - Splits on non-alphanumeric and camel humps (e.g., SalePrice -> Sale Price)
-    - Lowercases first token, title-cases subsequent tokens, and joins without separators
+    Scraped payloads repeat the same small set of field names across thousands
+    of records, so the cache turns nearly every call into a dict lookup.
     """
-    if not isinstance(key, str):
-        return key
-
     s = key.strip()
     # Remove Salesforce-style field suffix
     if s.endswith("__c"):
@@ -37,16 +52,64 @@ def to_camel_case(key: Any) -> Any:
     return "".join([head, *tail])
 
 
+def to_camel_case(key: Any) -> Any:
+    """Normalize arbitrary keys to lowerCamelCase without underscores/spaces.
+
+    - Removes trailing Salesforce suffix "__c" if present
+    - Splits on non-alphanumeric and camel humps (e.g., SalePrice -> Sale Price)
+    - Lowercases first token, title-cases subsequent tokens, and joins without separators
+    """
+    if not isinstance(key, str):
+        return key
+    # Already-normalized keys (plain lowercase alnum) need no conversion
+    if key.isalnum() and key.islower():
+        return key
+    return _camel_str(key)
+
+
 def normalize_keys(obj: Any) -> Any:
-    """Recursively convert dict keys to camelCase using to_camel_case.
+    """Convert dict keys to camelCase using to_camel_case.
 
     Lists are processed element-wise. Scalars are returned unchanged.
+    Traversal is iterative (explicit worklist) so deeply nested payloads
+    neither hit the recursion limit nor pay a Python frame per node.
     """
     if isinstance(obj, dict):
-        return {to_camel_case(k): normalize_keys(v) for k, v in obj.items()}
-    if isinstance(obj, list):
-        return [normalize_keys(v) for v in obj]
-    return obj
+        root: Any = {}
+    elif isinstance(obj, list):
+        root = []
+    else:
+        return obj
+
+    work = deque([(obj, root)])
+    while work:
+        src, dst = work.pop()
+        if isinstance(src, dict):
+            for k, v in src.items():
+                nk = to_camel_case(k)
+                if isinstance(v, dict):
+                    child: Any = {}
+                    dst[nk] = child
+                    work.append((v, child))
+                elif isinstance(v, list):
+                    child = []
+                    dst[nk] = child
+                    work.append((v, child))
+                else:
+                    dst[nk] = v
+        else:
+            for v in src:
+                if isinstance(v, dict):
+                    child = {}
+                    dst.append(child)
+                    work.append((v, child))
+                elif isinstance(v, list):
+                    child = []
+                    dst.append(child)
+                    work.append((v, child))
+                else:
+                    dst.append(v)
+    return root
 
 
 def ensure_parent(path: Path) -> None:
@@ -57,8 +120,18 @@ def save_json(data: Any, file_path: os.PathLike | str) -> Path:
     """Save data as pretty JSON (UTF-8) and return the Path to the file."""
     path = Path(file_path)
     ensure_parent(path)
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    if orjson is not None:
+        path.write_bytes(
+            orjson.dumps(
+                data,
+                option=orjson.OPT_INDENT_2
+                | orjson.OPT_NON_STR_KEYS
+                | orjson.OPT_SERIALIZE_NUMPY,
+            )
+        )
+    else:
+        with path.open("w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
     return path
 
 
@@ -1,10 +1,18 @@
 import json
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional
 import numpy as np
 import pandas as pd
 import streamlit as st
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 # Live API fetchers
 from scraper.ca_hcd import fetch_ca_hcd
 from scraper.rivcoview import fetch_rivcoview
@@ -18,6 +26,8 @@ def load_json(path: Path) -> Optional[Any]:
         if not path.exists():
             st.warning(f"File not found: {path}")
             return None
+        if orjson is not None:
+            return orjson.loads(path.read_bytes())
         with path.open("r", encoding="utf-8") as f:
             return json.load(f)
     except Exception as e:
@@ -31,38 +41,85 @@ def load_json_from_url(url: str) -> Optional[Any]:
         import requests
         response = requests.get(url)
         response.raise_for_status()
+        if orjson is not None:
+            return orjson.loads(response.content)
         return response.json()
     except Exception as e:
         st.error(f"Failed to load JSON from URL: {e}")
         return None
 
 # ---------- Cached dataset fetchers ----------
-@st.cache_data(show_spinner=False)
+@st.cache_data(ttl=3600, persist="disk", show_spinner=False)
 def cached_ca_hcd(county_code: str = "33") -> Any:
     """Cached CA HCD fetch."""
     return fetch_ca_hcd(county_code)
 
 
-@st.cache_data(show_spinner=False)
+@st.cache_data(ttl=3600, persist="disk", show_spinner=False)
 def cached_rivcoview(query_value: str = "Riverside", limit_rows: int | None = 200) -> Any:
     """Cached RivCoView fetch."""
     return fetch_rivcoview(query_value=query_value, limit_rows=limit_rows)
 
 
-@st.cache_data(show_spinner=False)
+@st.cache_data(ttl=3600, persist="disk", show_spinner=False)
 def cached_mhvillage_details(county: str = "Riverside", state: str = "CA") -> Any:
     """Cached MHVillage details fetch."""
     return fetch_mhvillage_details(county=county, state=state)
 
 def coerce_numeric(series: pd.Series) -> pd.Series:
     """Coerce a pandas Series to a numeric type, converting errors to NaN."""
+    if series.dtype == object:
+        head = series.head(10)
+        if len(head) and all(v is None or type(v) in (int, float) for v in head):
+            # The scrapers emit native ints/floats for fields like
+            # totalNumberLots; casting straight to a pyarrow-backed float
+            # skips pd.to_numeric's object-inference slow path.
+            try:
+                return pd.Series(
+                    pd.array(series.to_numpy(dtype=object), dtype="float64[pyarrow]"),
+                    index=series.index,
+                    name=series.name,
+                )
+            except (ImportError, ValueError, TypeError):
+                pass
     return pd.to_numeric(series, errors="coerce")
 
+def coerce_numeric_columns(df: pd.DataFrame, columns: list[str]) -> pd.DataFrame:
+    """Coerce every listed column that exists in a single pandas dispatch."""
+    existing = [c for c in columns if c in df.columns]
+    if existing:
+        df[existing] = df[existing].apply(coerce_numeric)
+    return df
+
+def sorted_options(series: pd.Series) -> list:
+    """Sorted unique values for a filter widget.
+
+    Sorting the unique ndarray in place uses NumPy's C sort instead of
+    boxing every element through Python's sorted() comparator.
+    """
+    # unique() can return an extension array (e.g. StringArray) with no
+    # in-place sort; np.asarray gives a plain ndarray either way
+    arr = np.asarray(series.dropna().unique())
+    try:
+        arr.sort()
+    except (TypeError, AttributeError):
+        # Mixed-type column: fall back to a keyed Python sort
+        return sorted(arr, key=str)
+    return arr.tolist()
+
 def as_dataframe(data: Any) -> pd.DataFrame:
     """Convert raw data (list, dict) into a pandas DataFrame."""
     if data is None:
         return pd.DataFrame()
     if isinstance(data, list):
+        # Already-flat records (CA HCD, MHVillage top level) don't need
+        # json_normalize walking every value looking for nesting.
+        if (
+            data
+            and isinstance(data[0], dict)
+            and not any(isinstance(v, (dict, list)) for v in data[0].values())
+        ):
+            return pd.DataFrame(data)
         try:
             return pd.json_normalize(data)
         except Exception:
@@ -74,23 +131,25 @@ def as_dataframe(data: Any) -> pd.DataFrame:
 def flatten_records_maybe(data: Any) -> list[dict]:
     """Flatten common list-of-list or list-of-dict-of-list shapes."""
     out: list[dict] = []
+    loads = orjson.loads if orjson is not None else json.loads
     if isinstance(data, list):
+        # Exact-type checks: API payloads only ever contain plain
+        # dict/list/str, and `type(x) is dict` skips the MRO walk.
         for item in data:
-            if isinstance(item, dict):
+            t = type(item)
+            if t is dict:
                 out.append(item)
-            elif isinstance(item, list):
-                for sub_item in item:
-                    if isinstance(sub_item, dict):
-                        out.append(sub_item)
-            elif isinstance(item, str):
+            elif t is list:
+                out.extend(sub for sub in item if type(sub) is dict)
+            elif t is str:
                 try:
-                    parsed = json.loads(item)
-                    if isinstance(parsed, dict):
-                        out.append(parsed)
-                    elif isinstance(parsed, list):
-                        out.extend(d for d in parsed if isinstance(d, dict))
-                except json.JSONDecodeError:
-                    pass
+                    parsed = loads(item)
+                except ValueError:
+                    continue
+                if type(parsed) is dict:
+                    out.append(parsed)
+                elif type(parsed) is list:
+                    out.extend(d for d in parsed if type(d) is dict)
     elif isinstance(data, dict):
         out.append(data)
     return out
@@ -122,6 +181,9 @@ def is_scalar(v: Any) -> bool:
     except Exception:
         return False
 
+_CONTAINER_TYPES = (list, tuple, set, dict, np.ndarray, pd.Series)
+
+
 def safe_json_dumps(v: Any) -> str:
     """Safely convert a value to JSON string."""
     try:
@@ -139,17 +201,59 @@ def sanitize_for_arrow(df: pd.DataFrame, prefer_cols: Optional[list[str]] = None
     if df.empty:
         return df
 
-    cleaned = df.copy()
-    for col in cleaned.columns:
-        s = cleaned[col]
+    # Only sanitize columns that can actually reach the UI: preferred ones
+    # first, then other columns up to 2x max_cols (slack for candidates
+    # that get dropped as unsafe below). Wide json_normalize output can
+    # carry hundreds of columns that would otherwise be coerced for nothing.
+    candidates = [c for c in (prefer_cols or []) if c in df.columns]
+    seen = set(candidates)
+    for c in df.columns:
+        if len(candidates) >= max_cols * 2:
+            break
+        if c not in seen:
+            candidates.append(c)
+            seen.add(c)
+    df = df[candidates]
+
+    # Rewrite only the columns that need coercion; unchanged columns are
+    # carried over by reference instead of deep-copying the whole frame.
+    cols: dict[Any, pd.Series] = {}
+    for col in df.columns:
+        s = df[col]
         if pd.api.types.is_numeric_dtype(s) or pd.api.types.is_bool_dtype(s) or pd.api.types.is_string_dtype(s):
+            cols[col] = s
             continue
-        
-        coerced_numeric = pd.to_numeric(s, errors='coerce')
-        if len(s.dropna()) > 0 and coerced_numeric.notna().sum() / len(s.dropna()) > 0.9:
-             cleaned[col] = coerced_numeric
+
+        notna = s.notna().to_numpy()
+        n_valid = int(notna.sum())
+        if n_valid == 0:
+            cols[col] = s
+            continue
+
+        # Container-valued columns can never coerce to numeric, so skip the
+        # pd.to_numeric scan when the first valid cell is a container.
+        first_valid = s.iloc[int(np.argmax(notna))]
+        if not isinstance(first_valid, _CONTAINER_TYPES):
+            coerced_numeric = pd.to_numeric(s, errors='coerce')
+            if coerced_numeric.notna().sum() / n_valid > 0.9:
+                cols[col] = coerced_numeric
+                continue
+
+        # Stringify only container-valued cells; a type mask avoids
+        # running is_scalar's try/except cascade on every scalar cell.
+        values = s.to_numpy(dtype=object)
+        mask = np.fromiter(
+            (isinstance(v, _CONTAINER_TYPES) for v in values),
+            dtype=bool,
+            count=len(values),
+        )
+        if mask.any():
+            converted = s.copy()
+            converted[mask] = [safe_json_dumps(v) for v in values[mask]]
+            cols[col] = converted
         else:
-            cleaned[col] = s.apply(lambda v: safe_json_dumps(v) if not is_scalar(v) else v)
+            cols[col] = s
+    cleaned = pd.DataFrame(cols, index=df.index)
 
     safe_cols = []
     for c in cleaned.columns:
@@ -167,76 +271,77 @@ def sanitize_for_arrow(df: pd.DataFrame, prefer_cols: Optional[list[str]] = None
     ordered_cols.extend([c for c in safe_cols if c not in ordered_cols])
     return cleaned[ordered_cols[:max_cols]] if ordered_cols else cleaned.iloc[:, :max_cols]
 
+# Column name mappings for better readability
+_COLUMN_MAPPINGS = {
+    'payload.name': 'Community Name',
+    'payload.relationships.address.streetAddress1': 'Street Address',
+    'payload.relationships.address.city': 'City',
+    'payload.relationships.address.state': 'State',
+    'payload.relationships.address.postalCode': 'Zip Code',
+    'payload.relationships.address.coordinatePoint.latitude': 'Latitude',
+    'payload.relationships.address.coordinatePoint.longitude': 'Longitude',
+    'payload.relationships.address.county': 'County',
+    'payload.relationships.siteCount.total': 'Total Sites',
+    'payload.relationships.siteCount.vacant': 'Vacant Sites',
+    'payload.relationships.homesCount.forSaleCount': 'Homes For Sale',
+    'payload.relationships.homesCount.forRentCount': 'Homes For Rent',
+    'payload.relationships.phone.number': 'Phone Number',
+    'payload.relationships.favoriteCount.total': 'Favorite Count',
+    'payload.averageMonthlyRent': 'Avg Monthly Rent',
+    'payload.ageRestrictions': 'Age Restrictions',
+    'payload.ageRestrictionsDescription': 'Age Restrictions Description',
+    'payload.petsAllowed': 'Pets Allowed',
+    'payload.isResidentOwned': 'Resident Owned',
+    'payload.yearBuilt': 'Year Built',
+    'payload.caption': 'Caption',
+    'payload.description': 'Description',
+    'payload.website': 'Website',
+    'payload.virtualTour': 'Virtual Tour'
+}
+
+_MAPPED_VALUES = frozenset(_COLUMN_MAPPINGS.values())
+
+
+@lru_cache(maxsize=512)
+def _clean_colname(col: str) -> str:
+    """Readable name for an unmapped column (cached across reruns)."""
+    # Remove payload.relationships. prefix and make readable
+    clean_col = col.replace('payload.relationships.', '').replace('payload.', '')
+    clean_col = clean_col.replace('.', ' ').replace('_', ' ')
+    # Capitalize words
+    return ' '.join(word.capitalize() for word in clean_col.split())
+
+
 def normalize_column_names(df: pd.DataFrame) -> pd.DataFrame:
     """Normalize column names to be more readable."""
-    df = df.copy()
-    
-    # Column name mappings for better readability
-    column_mappings = {
-        'payload.name': 'Community Name',
-        'payload.relationships.address.streetAddress1': 'Street Address',
-        'payload.relationships.address.city': 'City',
-        'payload.relationships.address.state': 'State',
-        'payload.relationships.address.postalCode': 'Zip Code',
-        'payload.relationships.address.coordinatePoint.latitude': 'Latitude',
-        'payload.relationships.address.coordinatePoint.longitude': 'Longitude',
-        'payload.relationships.address.county': 'County',
-        'payload.relationships.siteCount.total': 'Total Sites',
-        'payload.relationships.siteCount.vacant': 'Vacant Sites',
-        'payload.relationships.homesCount.forSaleCount': 'Homes For Sale',
-        'payload.relationships.homesCount.forRentCount': 'Homes For Rent',
-        'payload.relationships.phone.number': 'Phone Number',
-        'payload.relationships.favoriteCount.total': 'Favorite Count',
-        'payload.averageMonthlyRent': 'Avg Monthly Rent',
-        'payload.ageRestrictions': 'Age Restrictions',
-        'payload.ageRestrictionsDescription': 'Age Restrictions Description',
-        'payload.petsAllowed': 'Pets Allowed',
-        'payload.isResidentOwned': 'Resident Owned',
-        'payload.yearBuilt': 'Year Built',
-        'payload.caption': 'Caption',
-        'payload.description': 'Description',
-        'payload.website': 'Website',
-        'payload.virtualTour': 'Virtual Tour'
-    }
-    
-    # Apply mappings
-    df = df.rename(columns=column_mappings)
-    
-    # Clean up remaining column names
-    new_columns = {}
+    # Build one combined rename map so a single rename call suffices and the
+    # underlying column data is never copied.
+    rename_map = {}
     for col in df.columns:
-        if col not in column_mappings.values():  # Only process unmapped columns
-            # Remove payload.relationships. prefix and make readable
-            clean_col = col.replace('payload.relationships.', '').replace('payload.', '')
-            clean_col = clean_col.replace('.', ' ').replace('_', ' ')
-            # Capitalize words
-            clean_col = ' '.join(word.capitalize() for word in clean_col.split())
-            new_columns[col] = clean_col
-    
-    df = df.rename(columns=new_columns)
-    return df
+        if col in _COLUMN_MAPPINGS:
+            rename_map[col] = _COLUMN_MAPPINGS[col]
+        elif col not in _MAPPED_VALUES:  # Only process unmapped columns
+            rename_map[col] = _clean_colname(col)
 
-def extract_amenities(row: pd.Series) -> dict:
-    """Extract amenity information from the details array.
+    return df.rename(columns=rename_map)
 
-    Supports both raw column name 'payload.relationships.details' and
-    normalized 'Details'. Returns flat columns like 'amenity_Golf Course': 'Yes/No'.
-    """
-    # Locate details list in either raw or normalized column
-    details = row.get('payload.relationships.details', None)
-    if details is None:
-        details = row.get('Details', None)
-    if not isinstance(details, list):
-        return {}
+_CAMEL_AMENITY = re.compile(r'([a-z0-9])([A-Z])')
 
-    import re
 
-    def to_readable(name: str) -> str:
-        # Replace underscores, split camelCase like "golfCourse" -> "golf Course"
-        name = name.replace('_', ' ')
-        name = re.sub(r'([a-z0-9])([A-Z])', r'\1 \2', name)
-        name = name.replace('  ', ' ').strip()
-        return name.title()
+@lru_cache(maxsize=1024)
+def _to_readable(name: str) -> str:
+    """Turn an amenity type like 'golfCourse' into 'Golf Course' (cached)."""
+    # Replace underscores, split camelCase like "golfCourse" -> "golf Course"
+    name = name.replace('_', ' ')
+    name = _CAMEL_AMENITY.sub(r'\1 \2', name)
+    name = name.replace('  ', ' ').strip()
+    return name.title()
+
+
+def _amenities_from_details(details: Any) -> dict:
+    """Extract flat amenity columns from a single details list."""
+    if not isinstance(details, list):
+        return {}
 
     amenities: dict[str, Any] = {}
     amenity_categories = {'amenity', 'infrastructure', 'location'}
@@ -255,14 +360,49 @@ def extract_amenities(row: pd.Series) -> dict:
                 if isinstance(value, str) and value.strip() == '':
                     continue
                 # Create readable names for amenities
-                readable_name = to_readable(detail_type)
+                readable_name = _to_readable(detail_type)
                 amenities[f'amenity_{readable_name}'] = value
 
     return amenities
 
+
+def extract_amenities(row: pd.Series) -> dict:
+    """Extract amenity information from the details array.
+
+    Supports both raw column name 'payload.relationships.details' and
+    normalized 'Details'. Returns flat columns like 'amenity_Golf Course': 'Yes/No'.
+    """
+    details = row.get('payload.relationships.details', None)
+    if details is None:
+        details = row.get('Details', None)
+    return _amenities_from_details(details)
+
+
+def amenities_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Build flat amenity columns for a whole DataFrame at once.
+
+    A plain loop over the details column avoids the per-row Series
+    construction that df.apply(extract_amenities, axis=1) pays.
+    """
+    details_col = None
+    for name in ('payload.relationships.details', 'Details'):
+        if name in df.columns:
+            details_col = name
+            break
+    if details_col is None:
+        return pd.DataFrame(index=df.index)
+
+    records = [_amenities_from_details(d) for d in df[details_col].to_numpy()]
+    return pd.DataFrame.from_records(records, index=df.index)
+
 # ---------- File location helpers ----------
+@lru_cache(maxsize=16)
 def find_dataset_file(dataset: str) -> Optional[Path]:
-    """Return the first existing path for a dataset's results.json."""
+    """Return the first existing path for a dataset's results.json.
+
+    Cached per dataset so repeated reruns skip the four stat calls; the
+    per-dataset refresh buttons clear the cache.
+    """
     here = Path(__file__).resolve().parent
     candidates = [
         Path.cwd() / "data" / dataset / "results.json",
@@ -318,6 +458,7 @@ def section_header(
                     on_refresh()
                 finally:
                     pass
+            find_dataset_file.cache_clear()
             st.toast("Cache cleared. Re-fetching…", icon="🔄")
 
     
@@ -342,6 +483,27 @@ def _to_dt(s: Any) -> Optional[pd.Timestamp]:
         return None
     return pd.to_datetime(s, errors="coerce")
 
+_ISO_DATE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+def _num_batch(series: pd.Series) -> pd.Series:
+    """Bulk version of _num: parse currency-formatted values to floats.
+
+    Strips $/commas from the string entries with one vectorized
+    str.replace pass and converts everything with a single pd.to_numeric
+    call, instead of one Python-level _num call per value.
+    """
+    values = series.to_numpy(dtype=object)
+    str_mask = np.fromiter(
+        (isinstance(v, str) for v in values), dtype=bool, count=len(values)
+    )
+    cleaned = series
+    if str_mask.any():
+        cleaned = series.copy()
+        cleaned[str_mask] = (
+            series[str_mask].str.replace(r"[$,]", "", regex=True).str.strip()
+        )
+    return pd.to_numeric(cleaned, errors="coerce")
+
 def enrich_rivco_row(row: pd.Series) -> dict:
     """Extract and summarize nested sales and history data for a RivCoView row."""
     out: dict[str, Any] = {}
@@ -351,8 +513,19 @@ def enrich_rivco_row(row: pd.Series) -> dict:
         sales_dicts = [s for s in sales if isinstance(s, dict)]
         out["salesCount"] = len(sales_dicts)
         
-        last_sale = max(sales_dicts, key=lambda s: _to_dt(s.get("saledate")) or pd.Timestamp.min, default=None)
-        
+        # ISO-formatted saledate strings sort chronologically as plain
+        # strings, so skip the per-scalar pd.to_datetime unless a
+        # non-ISO value shows up.
+        dates = [s.get("saledate") for s in sales_dicts]
+        if all(isinstance(d, str) and _ISO_DATE.match(d) for d in dates if d):
+            last_sale = max(sales_dicts, key=lambda s: s.get("saledate") or "", default=None)
+        else:
+            # Mixed formats: parse the dates once in bulk. idxmax skips
+            # unparseable entries, so no per-element Timestamp sentinel
+            # is ever constructed.
+            parsed = pd.to_datetime(pd.Series(dates, dtype=object), errors="coerce")
+            last_sale = sales_dicts[int(parsed.idxmax())] if parsed.notna().any() else sales_dicts[0]
+
         if last_sale:
             out["lastSaleDate"] = last_sale.get("saledate")
             out["lastSalePrice"] = _num(last_sale.get("SalePrice") or last_sale.get("salePrice"))
@@ -383,6 +556,136 @@ def enrich_rivco_row(row: pd.Series) -> dict:
 
     return out
 
+
+def _coalesce_cols(frame: pd.DataFrame, names: list[str]) -> pd.Series:
+    """Return the first non-null value across alternately-cased columns."""
+    present = [frame[n] for n in names if n in frame.columns]
+    if not present:
+        return pd.Series([None] * len(frame), index=frame.index, dtype=object)
+    merged = present[0]
+    for col in present[1:]:
+        merged = merged.combine_first(col)
+    return merged
+
+
+def enrich_rivco_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Vectorized equivalent of applying enrich_rivco_row per row.
+
+    Explodes the nested sales/history lists once and aggregates them with a
+    single pd.to_datetime/pd.to_numeric call each, instead of paying a
+    scalar parse per entry inside a row-wise apply.
+    """
+    if df.empty:
+        return pd.DataFrame(index=df.index)
+    try:
+        out = pd.DataFrame(index=df.index)
+
+        if "sales" in df.columns:
+            s = df["sales"].explode().dropna()
+            s = s[s.map(lambda v: isinstance(v, dict))]
+            out["salesCount"] = s.groupby(level=0).size()
+            out["salesCount"] = out["salesCount"].fillna(0).astype(int)
+            if not s.empty:
+                sdf = pd.DataFrame(s.tolist())
+                sdf.index = s.index
+                if "saledate" not in sdf.columns:
+                    sdf["saledate"] = None
+                order = pd.to_datetime(sdf["saledate"], errors="coerce")
+                # Stable descending sort + head(1) picks the FIRST entry
+                # among tied max dates, matching the row-wise path's
+                # max()/idxmax tie-break; the default quicksort made the
+                # pick arbitrary on ties.
+                last = (
+                    sdf.assign(_ord=order.values)
+                    .sort_values("_ord", ascending=False, na_position="last", kind="stable")
+                    .groupby(level=0)
+                    .head(1)
+                )
+                out.loc[last.index, "lastSaleDate"] = last["saledate"]
+                out.loc[last.index, "lastSalePrice"] = _num_batch(
+                    _coalesce_cols(last, ["SalePrice", "salePrice"])
+                )
+                out.loc[last.index, "lastSaleQualified"] = _coalesce_cols(
+                    last, ["Qualified", "qualified"]
+                )
+
+        if "history" in df.columns:
+            h = df["history"].explode().dropna()
+            h = h[h.map(lambda v: isinstance(v, dict))]
+            if not h.empty:
+                hdf = pd.DataFrame(h.tolist())
+                hdf.index = h.index
+                year = pd.to_numeric(
+                    _coalesce_cols(hdf, ["TaxYear", "taxYear"]), errors="coerce"
+                ).fillna(0).astype(int)
+                hdf = hdf.assign(_year=year.values).sort_values("_year", kind="stable")
+                grp = hdf.groupby(level=0)
+                latest = grp.tail(1)
+                sizes = grp.size()
+                prev = grp.tail(2).groupby(level=0).head(1)
+                prev = prev[sizes.loc[prev.index] > 1]
+
+                out.loc[latest.index, "assessedYearLatest"] = _coalesce_cols(
+                    latest, ["TaxYear", "taxYear"]
+                ).map(str)
+                out.loc[latest.index, "assessedLatest"] = _num_batch(
+                    _coalesce_cols(latest, ["AssessedTot", "assessedTot"])
+                )
+                out.loc[prev.index, "assessedPrev"] = _num_batch(
+                    _coalesce_cols(prev, ["AssessedTot", "assessedTot"])
+                )
+
+                la = out.get("assessedLatest")
+                pr = out.get("assessedPrev")
+                if la is not None and pr is not None:
+                    valid = la.notna() & pr.notna() & (pr != 0)
+                    if valid.any():
+                        out.loc[valid, "assessedYoYDelta"] = la[valid] - pr[valid]
+                        out.loc[valid, "assessedYoYPct"] = (
+                            (la[valid] - pr[valid]) / pr[valid] * 100.0
+                        )
+
+        return out
+    except Exception:
+        # Unexpected shapes: fall back to the row-wise path
+        return df.apply(enrich_rivco_row, axis=1, result_type="expand")
+
+
+# ---------- Cached frame builders ----------
+# Streamlit re-executes the render functions on every widget interaction;
+# caching the raw-records -> enriched-DataFrame step means only the cheap
+# filter/KPI/display code reruns.
+@st.cache_data(show_spinner=False)
+def _build_mhvillage_frame(data: Any) -> pd.DataFrame:
+    """Readable columns, flat amenity columns, and numeric coercion."""
+    df = as_dataframe(data)
+    if df.empty:
+        return df
+    df = normalize_column_names(df)
+    amenities_data = amenities_frame(df)
+    if not amenities_data.empty:
+        df = pd.concat([df, amenities_data], axis=1)
+    numeric_cols = [
+        'Total Sites', 'Vacant Sites', 'Homes For Sale', 'Homes For Rent',
+        'Latitude', 'Longitude', 'Avg Monthly Rent', 'Favorite Count'
+    ]
+    return coerce_numeric_columns(df, numeric_cols)
+
+
+@st.cache_data(show_spinner=False)
+def _build_rivco_frame(data: Any) -> pd.DataFrame:
+    """Flattened records with coerced numerics and sales/history enrichment."""
+    flat = flatten_records_maybe(data)
+    df = as_dataframe(flat)
+    if df.empty:
+        return df
+    df = coerce_numeric_columns(df, ["lat", "lng", "taxTotal"])
+    df = df.rename(columns={"class_code": "classCode"})
+    extras = enrich_rivco_frame(df)
+    if not extras.empty:
+        df = pd.concat([df, extras], axis=1)
+    return df
+
 # ---------- Render Functions for Each Dataset ----------
 def render_ca_hcd():
     # Header with per-dataset refresh
@@ -401,16 +704,14 @@ def render_ca_hcd():
         return
 
     numeric_cols = ["totalNumberLots", "numberMhLots", "numberRvLotsDrains", "numberRvLotsNoDrains", "statusId"]
-    for c in numeric_cols:
-        if c in df.columns:
-            df[c] = coerce_numeric(df[c])
+    df = coerce_numeric_columns(df, numeric_cols)
 
     cols = st.columns(3)
     with cols[0]:
-        cities = sorted(df["city"].dropna().unique()) if "city" in df.columns else []
+        cities = sorted_options(df["city"]) if "city" in df.columns else []
         sel_cities = st.multiselect("City", options=cities, key="ca_hcd_city")
     with cols[1]:
-        statuses = sorted(df["statusId"].dropna().unique()) if "statusId" in df.columns else []
+        statuses = sorted_options(df["statusId"]) if "statusId" in df.columns else []
         sel_status = st.multiselect("StatusId", options=statuses, key="ca_hcd_status")
     with cols[2]:
         if "totalNumberLots" in df.columns:
@@ -461,18 +762,12 @@ def render_rivcoview():
     )
     with st.spinner("Fetching RivCoView parcels..."):
         data = cached_rivcoview()
-    flat = flatten_records_maybe(data)
-    df = as_dataframe(flat)
+    df = _build_rivco_frame(data)
 
     if df.empty:
         st.info("No RivCoView data to display.")
         return
 
-    for c in ["lat", "lng", "taxTotal"]:
-        if c in df.columns:
-            df[c] = coerce_numeric(df[c])
-    df = df.rename(columns={"class_code": "classCode"})
-
     cols = st.columns(3)
     # Prefer new 'city' field appended by scraper; fallback to legacy columns
     city_col = (
@@ -483,10 +778,10 @@ def render_rivcoview():
         )
     )
     with cols[0]:
-        cities = sorted(df[city_col].dropna().unique()) if city_col and city_col in df.columns else []
+        cities = sorted_options(df[city_col]) if city_col and city_col in df.columns else []
         sel_cities = st.multiselect("City", options=cities, key="rivco_city")
     with cols[1]:
-        classes = sorted(df["classCode"].dropna().unique()) if "classCode" in df.columns else []
+        classes = sorted_options(df["classCode"]) if "classCode" in df.columns else []
         sel_class = st.multiselect("Class code", options=classes, key="rivco_class")
     with cols[2]:
         has_geo = st.checkbox("Only with coordinates", value=True, key="rivco_has_geo")
@@ -501,10 +796,8 @@ def render_rivcoview():
 
     
     
-    enrich_df = fdf.copy()
-    if not enrich_df.empty:
-        extras = enrich_df.apply(enrich_rivco_row, axis=1, result_type="expand")
-        enrich_df = pd.concat([enrich_df, extras], axis=1)
+    # Enrichment columns are precomputed by _build_rivco_frame
+    enrich_df = fdf
 
     c1, c2, c3 = st.columns(3)
     c1.metric("Parcels", f"{len(fdf):,}")
@@ -534,34 +827,16 @@ def render_mhvillage():
     )
     with st.spinner("Fetching MHVillage communities..."):
         data = cached_mhvillage_details()
-    df = as_dataframe(data)
+    df = _build_mhvillage_frame(data)
 
     if df.empty:
         st.info("No MHVillage data to display.")
         return
 
-    # Normalize human-friendly columns
-    df = normalize_column_names(df)
-
-    # Extract amenities into flat columns
-    if not df.empty:
-        amenities_data = df.apply(extract_amenities, axis=1, result_type="expand")
-        if amenities_data is not None and not amenities_data.empty:
-            df = pd.concat([df, amenities_data], axis=1)
-
-    # Convert relevant numeric fields
-    numeric_cols = [
-        'Total Sites', 'Vacant Sites', 'Homes For Sale', 'Homes For Rent',
-        'Latitude', 'Longitude', 'Avg Monthly Rent', 'Favorite Count'
-    ]
-    for col in numeric_cols:
-        if col in df.columns:
-            df[col] = coerce_numeric(df[col])
-
     # Filters
     cols = st.columns(3)
     with cols[0]:
-        cities = sorted(df['City'].dropna().unique()) if 'City' in df.columns else []
+        cities = sorted_options(df['City']) if 'City' in df.columns else []
         sel_cities = st.multiselect("City", options=cities, key="mh_city")
     with cols[1]:
         if 'Total Sites' in df.columns and df['Total Sites'].notna().any():
@@ -591,8 +866,15 @@ def render_mhvillage():
     k2.metric("Total sites", f"{int(total_sites_sum):,}")
 
     photos_metric = 0
-    if 'Photos' in fdf.columns:
-        photos_metric = int(fdf['Photos'].apply(lambda v: isinstance(v, list) and len(v) > 0).sum())
+    if 'Photos' in fdf.columns and len(fdf):
+        photos = fdf['Photos'].to_numpy(dtype=object)
+        photos_metric = int(
+            np.fromiter(
+                (type(v) is list and len(v) > 0 for v in photos),
+                dtype=bool,
+                count=len(photos),
+            ).sum()
+        )
     k3.metric("With photos", f"{photos_metric:,}")
 
     # Map
@@ -622,6 +904,23 @@ def render_mhvillage():
     st.dataframe(sanitize_for_arrow(fdf, prefer_cols=show_cols, max_cols=25), use_container_width=True)
 
 # ---------- Main render loop ----------
+# Prewarm the dataset caches concurrently. The fetchers are network-bound,
+# so cold-start latency drops from the sum of the three calls to the max;
+# each render function then finds its cache already populated.
+_PREWARM_FETCHERS = {
+    "CA HCD": cached_ca_hcd,
+    "RivCoView": cached_rivcoview,
+    "MHVillage": cached_mhvillage_details,
+}
+if len(chosen) > 1:
+    with ThreadPoolExecutor(max_workers=3) as _pool:
+        _futures = [_pool.submit(_PREWARM_FETCHERS[name]) for name in chosen if name in _PREWARM_FETCHERS]
+        for _f in _futures:
+            try:
+                _f.result()
+            except Exception:
+                pass  # each render function surfaces its own fetch errors
+
 if "CA HCD" in chosen:
     render_ca_hcd()
     st.divider()
@@ -15,22 +15,88 @@ Notes:
 from __future__ import annotations
 
 import argparse
+import csv
 import json
+import os
 import sys
 import time
-from datetime import datetime
+import types
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Any, List
 import threading
 
-import pandas as pd
-
-
-# Minimal county name -> HCD county code mapping. Extend as needed.
-HCD_COUNTY_CODE = {
-    # Commonly used
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+
+# County name -> HCD county code, all 58 CA counties (codes follow the
+# alphabetical ordering HCD uses). Keys are pre-casefolded so lookups
+# never re-normalize the table; the proxy keeps it read-only.
+HCD_COUNTY_CODE = types.MappingProxyType({
+    "alameda": "01",
+    "alpine": "02",
+    "amador": "03",
+    "butte": "04",
+    "calaveras": "05",
+    "colusa": "06",
+    "contra costa": "07",
+    "del norte": "08",
+    "el dorado": "09",
+    "fresno": "10",
+    "glenn": "11",
+    "humboldt": "12",
+    "imperial": "13",
+    "inyo": "14",
+    "kern": "15",
+    "kings": "16",
+    "lake": "17",
+    "lassen": "18",
+    "los angeles": "19",
+    "madera": "20",
+    "marin": "21",
+    "mariposa": "22",
+    "mendocino": "23",
+    "merced": "24",
+    "modoc": "25",
+    "mono": "26",
+    "monterey": "27",
+    "napa": "28",
+    "nevada": "29",
+    "orange": "30",
+    "placer": "31",
+    "plumas": "32",
     "riverside": "33",
-}
+    "sacramento": "34",
+    "san benito": "35",
+    "san bernardino": "36",
+    "san diego": "37",
+    "san francisco": "38",
+    "san joaquin": "39",
+    "san luis obispo": "40",
+    "san mateo": "41",
+    "santa barbara": "42",
+    "santa clara": "43",
+    "santa cruz": "44",
+    "shasta": "45",
+    "sierra": "46",
+    "siskiyou": "47",
+    "solano": "48",
+    "sonoma": "49",
+    "stanislaus": "50",
+    "sutter": "51",
+    "tehama": "52",
+    "trinity": "53",
+    "tulare": "54",
+    "tuolumne": "55",
+    "ventura": "56",
+    "yolo": "57",
+    "yuba": "58",
+})
+
+KNOWN_SOURCES = ("ca_hcd", "mhvillage", "rivcoview")
 
 
 class _Spinner:
@@ -47,6 +113,11 @@ class _Spinner:
         self._stop = threading.Event()
         self._thread: threading.Thread | None = None
         self._isatty = sys.stderr.isatty() if hasattr(sys.stderr, "isatty") else True
+        # Precompute the full frame strings so each tick is a single
+        # unbuffered os.write: no f-string build, encode, or flush while
+        # the scrape is running.
+        self._frames = [f"\r⏳ {message} {fr}".encode() for fr in self.FRAMES]
+        self._clear = b"\r" + b" " * (len(message) + 6) + b"\r"
 
     def start(self) -> None:
         if not self._isatty:
@@ -56,15 +127,15 @@ class _Spinner:
 
         def run():
             i = 0
+            fd = sys.stderr.fileno()
+            frames = self._frames
+            wait = self._stop.wait
             while not self._stop.is_set():
-                frame = self.FRAMES[i % len(self.FRAMES)]
-                sys.stderr.write(f"\r⏳ {self.message} {frame}")
-                sys.stderr.flush()
+                os.write(fd, frames[i & 3])  # len(FRAMES) == 4
                 i += 1
-                self._stop.wait(0.1)
+                wait(0.1)
             # Clear spinner line on stop
-            sys.stderr.write("\r" + " " * (len(self.message) + 6) + "\r")
-            sys.stderr.flush()
+            os.write(fd, self._clear)
 
         self._thread = threading.Thread(target=run, daemon=True)
         self._thread.start()
@@ -81,27 +152,105 @@ def ensure_parent(path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
 
 
-def to_dataframe(data: Any) -> pd.DataFrame:
+def _flatten_record(d: dict, prefix: str = "", out: dict | None = None) -> dict:
+    """Flatten nested dicts into dotted keys (lists are kept as values)."""
+    if out is None:
+        out = {}
+    for k, v in d.items():
+        nk = f"{prefix}.{k}" if prefix else k
+        if isinstance(v, dict):
+            _flatten_record(v, nk, out)
+        else:
+            out[nk] = v
+    return out
+
+
+def to_dataframe(data: Any) -> "pd.DataFrame":
+    # pandas only matters on the CSV fallback path; importing it here keeps
+    # --help and JSON runs from paying its startup cost.
+    import pandas as pd
+
     if data is None:
         return pd.DataFrame()
     if isinstance(data, list):
+        # RivCoView detail responses can be lists of dicts; expand those
+        # into their items so the frame sees one row per record (same
+        # shape-handling as the app's flatten_records_maybe)
+        if any(isinstance(r, list) for r in data):
+            flat: list = []
+            for r in data:
+                if isinstance(r, list):
+                    flat.extend(x for x in r if isinstance(x, dict))
+                else:
+                    flat.append(r)
+            data = flat
+        if data and all(isinstance(r, dict) for r in data):
+            # Scraped records are usually flat already; when they are,
+            # build the frame directly, and when they nest, run a minimal
+            # dict flattener -- both are far cheaper than json_normalize.
+            if not any(isinstance(v, dict) for r in data for v in r.values()):
+                return pd.DataFrame.from_records(data)
+            return pd.DataFrame.from_records(
+                [_flatten_record(r) for r in data if isinstance(r, dict)]
+            )
         try:
             return pd.json_normalize(data)
         except Exception:
             return pd.DataFrame(data)
     if isinstance(data, dict):
-        return pd.json_normalize([data])
+        return pd.DataFrame.from_records([_flatten_record(data)])
     return pd.DataFrame()
 
 
-def write_output(data: List[dict] | Any, out_path: Path) -> None:
+def write_output(data: List[dict] | Any, out_path: Path, pretty: bool = False) -> None:
     ext = out_path.suffix.lower()
     ensure_parent(out_path)
     if ext == ".json":
-        with out_path.open("w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        # Compact by default: the output is machine-read, and skipping the
+        # indent roughly halves both the serialize time and the file size.
+        if orjson is not None:
+            # Native serializer: one bytes blob, one write call
+            option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+            if pretty:
+                option |= orjson.OPT_INDENT_2
+            with out_path.open("wb") as f:
+                f.write(orjson.dumps(data, option=option))
+        else:
+            with out_path.open("w", encoding="utf-8") as f:
+                json.dump(
+                    data,
+                    f,
+                    indent=2 if pretty else None,
+                    separators=None if pretty else (",", ":"),
+                    ensure_ascii=False,
+                )
         return
     if ext == ".csv":
+        # Plain lists of flat dicts go straight through csv.DictWriter;
+        # building a DataFrame just to serialize once pays for
+        # construction and dtype inference we never use. Every record
+        # gets checked — a list record or nested value past a sample
+        # would crash the writer or come out as a Python repr (RivCoView
+        # details can legitimately be lists).
+        if (
+            isinstance(data, list)
+            and data
+            and all(
+                isinstance(r, dict)
+                and not any(isinstance(v, (dict, list)) for v in r.values())
+                for r in data
+            )
+        ):
+            fieldnames: dict[str, None] = {}
+            for rec in data:
+                fieldnames.update(dict.fromkeys(rec))
+            with out_path.open("w", encoding="utf-8-sig", newline="") as f:
+                writer = csv.DictWriter(
+                    f, fieldnames=list(fieldnames), extrasaction="ignore"
+                )
+                writer.writeheader()
+                writer.writerows(data)
+            return
         df = to_dataframe(data)
         df.to_csv(out_path, index=False, encoding="utf-8-sig")
         return
@@ -113,8 +262,10 @@ def run_cli() -> None:
     parser.add_argument(
         "--source",
         required=True,
-        choices=["ca_hcd", "mhvillage", "rivcoview"],
-        help="Which scraper to run",
+        help=(
+            "Scraper(s) to run: ca_hcd, mhvillage, rivcoview. "
+            "Pass a comma-separated list to fetch several sources concurrently"
+        ),
     )
     parser.add_argument(
         "--county",
@@ -144,6 +295,29 @@ def run_cli() -> None:
         type=Path,
         help="Output file path (.json or .csv)",
     )
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Indent JSON output for human reading (default: compact)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=64,
+        help="Max in-flight detail requests for scrapers that fan out (default: 64)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        dest="cache_dir",
+        type=Path,
+        default=None,
+        help="Directory for the on-disk HTTP response cache (default: ~/.cache/aziz)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Bypass the on-disk HTTP response cache and always re-fetch",
+    )
     parser.add_argument(
         "-v",
         "--verbose",
@@ -153,60 +327,102 @@ def run_cli() -> None:
 
     args = parser.parse_args()
 
-    source = args.source
+    # Configure response caching before any scraper import fires a request
+    from lib import http_cache
+
+    if args.no_cache:
+        http_cache.configure(None)
+    else:
+        http_cache.configure(args.cache_dir or http_cache.default_dir())
+
+    sources = [s.strip() for s in args.source.split(",") if s.strip()]
+    if not sources:
+        raise SystemExit(
+            f"No sources given. Choose from: {', '.join(KNOWN_SOURCES)}"
+        )
+    unknown = [s for s in sources if s not in KNOWN_SOURCES]
+    if unknown:
+        raise SystemExit(
+            f"Unknown source(s): {', '.join(unknown)}. Choose from: {', '.join(KNOWN_SOURCES)}"
+        )
+
     county = args.county
     state = args.state
     county_code = args.county_code
     limit = max(0, int(args.limit)) if args.limit is not None else 0
+    concurrency = max(1, int(args.concurrency))
     out_path: Path = args.out
     verbose: bool = bool(args.verbose)
 
-    data_raw: List[dict] | Any = []
+    # Resolve the HCD county code up front (also warns once, not per worker)
+    code = county_code
+    if "ca_hcd" in sources and not code:
+        key = county.strip().casefold() if county else ""
+        code = HCD_COUNTY_CODE.get(key)
+        if not code:
+            print(
+                (
+                    f"Warning: Unrecognized county '{county}' for CA HCD; defaulting to Riverside (33). "
+                    "Use --county-code to specify explicitly."
+                ),
+                file=sys.stderr,
+            )
+            code = HCD_COUNTY_CODE["riverside"]
+
+    def fetch_source(source: str) -> Any:
+        # Lazy imports to allow --help without deps; each scraper manages
+        # its own AsyncSession so connections stay warm for its whole run
+        if source == "ca_hcd":
+            from scraper.ca_hcd import fetch_ca_hcd
+
+            return fetch_ca_hcd(code, limit=limit or None)
+        if source == "mhvillage":
+            from scraper.mhvillage import fetch_mhvillage_details
+
+            # Cap enumeration inside the scraper so pagination and the
+            # per-park detail fetches stop once the limit is satisfied
+            return fetch_mhvillage_details(
+                county=county,
+                state=state,
+                max_records=limit or None,
+                concurrency=concurrency,
+            )
+        from scraper.rivcoview import fetch_rivcoview
+
+        return fetch_rivcoview(query_value=county, limit_rows=limit)
+
+    def out_path_for(source: str) -> Path:
+        if len(sources) == 1:
+            return out_path
+        return out_path.with_name(f"{out_path.stem}_{source}{out_path.suffix}")
 
     # Timing
     t0 = time.perf_counter()
-    start_iso = datetime.now().isoformat(timespec="seconds")
+    start_iso = time.strftime("%Y-%m-%dT%H:%M:%S")
 
     # Live progress indicator
     spin_msg = {
         "ca_hcd": "Fetching CA HCD parks",
         "mhvillage": "Fetching MHVillage community details (can take a while)",
         "rivcoview": "Fetching RivCoView parcel details",
-    }.get(source, "Fetching data")
+    }.get(sources[0], "Fetching data") if len(sources) == 1 else (
+        f"Fetching {len(sources)} sources concurrently"
+    )
     spinner = _Spinner(spin_msg)
 
+    results: dict[str, Any] = {}
     try:
         spinner.start()
 
-        if source == "ca_hcd":
-            # Lazy import to allow --help without deps
-            from scraper.ca_hcd import fetch_ca_hcd
-
-            code = county_code
-            if not code:
-                key = (county or "").strip().lower()
-                code = HCD_COUNTY_CODE.get(key)
-                if not code:
-                    print(
-                        (
-                            f"Warning: Unrecognized county '{county}' for CA HCD; defaulting to Riverside (33). "
-                            "Use --county-code to specify explicitly."
-                        ),
-                        file=sys.stderr,
-                    )
-                    code = HCD_COUNTY_CODE["riverside"]
-            data_raw = fetch_ca_hcd(code)
-
-        elif source == "mhvillage":
-            from scraper.mhvillage import fetch_mhvillage_details
-
-            # Use default pagination inside, then slice
-            data_raw = fetch_mhvillage_details(county=county, state=state)
-
-        elif source == "rivcoview":
-            from scraper.rivcoview import fetch_rivcoview
-
-            data_raw = fetch_rivcoview(query_value=county, limit_rows=limit)
+        if len(sources) == 1:
+            results[sources[0]] = fetch_source(sources[0])
+        else:
+            # The scrapers are network-bound, so a small thread pool turns
+            # total wall time into the slowest source instead of the sum.
+            with ThreadPoolExecutor(max_workers=len(sources)) as pool:
+                futures = {pool.submit(fetch_source, s): s for s in sources}
+                for fut in as_completed(futures):
+                    results[futures[fut]] = fut.result()
 
     except KeyboardInterrupt:
         spinner.stop("⚠️  Aborted by user.")
@@ -214,7 +430,7 @@ def run_cli() -> None:
         print(
             (
                 "Run aborted\n"
-                f"  Source: {source}\n"
+                f"  Source: {', '.join(sources)}\n"
                 f"  Duration: {elapsed:.2f}s\n"
                 f"  Started: {start_iso}\n"
             ),
@@ -227,7 +443,7 @@ def run_cli() -> None:
         print(
             (
                 "Run failed\n"
-                f"  Source: {source}\n"
+                f"  Source: {', '.join(sources)}\n"
                 f"  Error: {e}\n"
                 f"  Duration: {elapsed:.2f}s\n"
                 f"  Started: {start_iso}\n"
@@ -238,53 +454,62 @@ def run_cli() -> None:
     else:
         spinner.stop("✅ Fetch complete.")
 
-    # Enforce limit after fetch if requested
-    size_raw = len(data_raw) if isinstance(data_raw, list) else (1 if data_raw else 0)
-    data: List[dict] | Any = data_raw
-    if isinstance(data_raw, list) and limit:
-        data = data_raw[:limit]
+    end_iso = time.strftime("%Y-%m-%dT%H:%M:%S")
+    elapsed = time.perf_counter() - t0
 
-    # Persist
-    write_output(data, out_path)
+    summaries: list[str] = []
+    for source in sources:
+        data_raw = results.get(source)
+
+        # Enforce limit after fetch if requested; only copy the prefix when
+        # the limit actually clips the list
+        size_raw = len(data_raw) if isinstance(data_raw, list) else (1 if data_raw else 0)
+        data: List[dict] | Any = data_raw
+        final_count = size_raw
+        if isinstance(data_raw, list) and 0 < limit < size_raw:
+            data = data_raw[:limit]
+            final_count = limit
+
+        # Persist
+        dest = out_path_for(source)
+        write_output(data, dest, pretty=bool(args.pretty))
+
+        # Compute run stats
+        rate = (final_count / elapsed) if elapsed > 0 else float("inf")
+        try:
+            bytes_out = dest.stat().st_size
+        except Exception:
+            bytes_out = 0
 
-    # Compute run stats
-    end_iso = datetime.now().isoformat(timespec="seconds")
-    elapsed = time.perf_counter() - t0
-    final_count = len(data) if isinstance(data, list) else (1 if data else 0)
-    rate = (final_count / elapsed) if elapsed > 0 else float("inf")
-    try:
-        bytes_out = out_path.stat().st_size
-    except Exception:
-        bytes_out = 0
-
-    # Detailed run summary
-    lines = [
-        "Run summary",
-        f"  Source: {source}",
-    ]
-    if source == "ca_hcd":
-        lines.append(f"  County code: {code}")
-    if source == "mhvillage":
-        lines.append(f"  County/State: {county}, {state}")
-    if source == "rivcoview":
-        lines.append(f"  Query value: {county}")
-    lines.extend(
-        [
-            f"  Limit requested: {limit}",
-            f"  Records fetched (raw): {size_raw}",
-            f"  Records written: {final_count}",
-            f"  Output file: {out_path}",
-            f"  Output size: {bytes_out:,} bytes",
-            f"  Started: {start_iso}",
-            f"  Finished: {end_iso}",
-            f"  Duration: {elapsed:.2f}s",
-            f"  Throughput: {rate:.2f} rec/s",
+        # Detailed run summary
+        lines = [
+            "Run summary",
+            f"  Source: {source}",
         ]
-    )
-    if verbose:
-        lines.append("  Mode: verbose")
+        if source == "ca_hcd":
+            lines.append(f"  County code: {code}")
+        if source == "mhvillage":
+            lines.append(f"  County/State: {county}, {state}")
+        if source == "rivcoview":
+            lines.append(f"  Query value: {county}")
+        lines.extend(
+            [
+                f"  Limit requested: {limit}",
+                f"  Records fetched (raw): {size_raw}",
+                f"  Records written: {final_count}",
+                f"  Output file: {dest}",
+                f"  Output size: {bytes_out:,} bytes",
+                f"  Started: {start_iso}",
+                f"  Finished: {end_iso}",
+                f"  Duration: {elapsed:.2f}s",
+                f"  Throughput: {rate:.2f} rec/s",
+            ]
+        )
+        if verbose:
+            lines.append("  Mode: verbose")
+        summaries.append("\n".join(lines))
 
-    print("\n".join(lines))
+    print("\n\n".join(summaries))
 
 
 if __name__ == "__main__":
@@ -6,84 +6,177 @@ without saving to disk. Default county code 33 = Riverside.
 
 from __future__ import annotations
 
+import asyncio
 import os
 import sys
 from typing import Any
 
-from curl_cffi import requests
+from curl_cffi.requests import AsyncSession
 
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
-from lib.json_utils import normalize_keys  # noqa: E402
+from lib import http_cache  # noqa: E402
+from lib.json_utils import json_loads, normalize_keys  # noqa: E402
+
+
+# Built once; _headers() hands out the same dict because neither we nor
+# curl_cffi mutate it. impersonate= on the session supplies the
+# user-agent and sec-ch-ua client hints consistently with the TLS
+# fingerprint, so only the request-specific headers remain here.
+_HEADERS = {
+    "accept": "*/*",
+    "accept-language": "en-US,en;q=0.9",
+    "cache-control": "no-cache",
+    "content-type": "application/x-www-form-urlencoded; charset=UTF-8",
+    "origin": "https://cahcd.my.site.com",
+    "pragma": "no-cache",
+    "priority": "u=1, i",
+    "referer": "https://cahcd.my.site.com/s/mobilehomeparksearch",
+    "sec-fetch-dest": "empty",
+    "sec-fetch-mode": "cors",
+    "sec-fetch-site": "same-origin",
+}
 
 
 def _headers() -> dict:
-    return {
-        "accept": "*/*",
-        "accept-language": "en-US,en;q=0.9",
-        "cache-control": "no-cache",
-        "content-type": "application/x-www-form-urlencoded; charset=UTF-8",
-        "origin": "https://cahcd.my.site.com",
-        "pragma": "no-cache",
-        "priority": "u=1, i",
-        "referer": "https://cahcd.my.site.com/s/mobilehomeparksearch",
-        "sec-ch-ua": '"Not;A=Brand";v="99", "Microsoft Edge";v="139", "Chromium";v="139"',
-        "sec-ch-ua-mobile": "?0",
-        "sec-ch-ua-platform": '"Windows"',
-        "sec-fetch-dest": "empty",
-        "sec-fetch-mode": "cors",
-        "sec-fetch-site": "same-origin",
-        "user-agent": (
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-            "(KHTML, like Gecko) Chrome/139.0.0.0 Safari/537.36 Edg/139.0.0.0"
-        ),
-    }
-
-
-def fetch_ca_hcd(county_code: str = "33") -> Any:
-    """Fetch CA HCD Mobile Home Park search results for a county code.
+    return _HEADERS
 
-    Returns the parsed JSON (normalized keys) without saving to disk.
-    county_code "33" corresponds to Riverside County.
+
+_AURA_URL = "https://cahcd.my.site.com/s/sfsites/aura?r=4&aura.ApexAction.execute=1"
+
+
+# The Aura payload is constant except for the county code, so it is
+# pre-encoded once as two bytes halves split at the code's position;
+# building a request is then a single concatenation and curl_cffi sends
+# the bytes through without re-encoding.
+_PAYLOAD_PRE = (
+    b"message=%7B%22actions%22%3A%5B%7B%22id%22%3A%22148%3Ba%22%2C%22descriptor%22%3A%22aura%3A%2F%2F"
+    b"ApexActionController%2FACTION%24execute%22%2C%22callingDescriptor%22%3A%22UNKNOWN%22%2C%22params%22"
+    b"%3A%7B%22namespace%22%3A%22%22%2C%22classname%22%3A%22MobileHomeParksSearchController%22%2C%22"
+    b"method%22%3A%22getSearchResults%22%2C%22params%22%3A%7B%22searchParams%22%3A%22%7B%5C%22parkstatus%5C%22%3A%5C%22All%5C%22%2C%5C%22county%5C%22%3A%5C%22"
+)
+_PAYLOAD_POST = (
+    b"%5C%22%2C%5C%22city%5C%22%3A%5C%22All%20Cities%5C%22%7D%22%7D%2C%22cacheable%22%3Afalse%2C%22isContinuation%22%3Afalse%7D%7D%5D%7D&"
+    b"aura.context=%7B%22mode%22%3A%22PROD%22%2C%22fwuid%22%3A%22eE5UbjZPdVlRT3M0d0xtOXc5MzVOQWg5TGxiTHU3MEQ5RnBMM0VzVXc1cmcxMi42MjkxNDU2LjE2Nzc3MjE2%22%2C%22app%22%3A%22siteforce%3AcommunityApp%22%2C%22loaded%22%3A%7B%22APPLICATION%40markup%3A%2F%2Fsiteforce%3AcommunityApp%22%3A%221305_7pTC6grCTP7M16KdvDQ-Xw%22%7D%2C%22dn%22%3A%5B%5D%2C%22globals%22%3A%7B%7D%2C%22uad%22%3Atrue%7D&"
+    b"aura.pageURI=%2Fs%2Fmobilehomeparksearch&aura.token=null"
+)
+
+
+def _build_payload(county_code: str) -> bytes:
+    return _PAYLOAD_PRE + county_code.encode() + _PAYLOAD_POST
+
+
+def _extract_query_results(data: Any) -> Any:
+    """Walk actions[*].returnValue(.returnValue).queryResults in one pass.
+
+    Salesforce Aura responses nest the payload a few levels deep
+    (sometimes under a doubled 'returnValue'); return the first
+    queryResults found, or None.
     """
-    url = "https://cahcd.my.site.com/s/sfsites/aura?r=4&aura.ApexAction.execute=1"
-
-    payload = (
-        "message=%7B%22actions%22%3A%5B%7B%22id%22%3A%22148%3Ba%22%2C%22descriptor%22%3A%22aura%3A%2F%2F"
-        "ApexActionController%2FACTION%24execute%22%2C%22callingDescriptor%22%3A%22UNKNOWN%22%2C%22params%22"
-        "%3A%7B%22namespace%22%3A%22%22%2C%22classname%22%3A%22MobileHomeParksSearchController%22%2C%22"
-        "method%22%3A%22getSearchResults%22%2C%22params%22%3A%7B%22searchParams%22%3A%22%7B%5C%22parkstatus%5C%22%3A%5C%22All%5C%22%2C%5C%22county%5C%22%3A%5C%22"
-        f"{county_code}"
-        "%5C%22%2C%5C%22city%5C%22%3A%5C%22All%20Cities%5C%22%7D%22%7D%2C%22cacheable%22%3Afalse%2C%22isContinuation%22%3Afalse%7D%7D%5D%7D&"
-        "aura.context=%7B%22mode%22%3A%22PROD%22%2C%22fwuid%22%3A%22eE5UbjZPdVlRT3M0d0xtOXc5MzVOQWg5TGxiTHU3MEQ5RnBMM0VzVXc1cmcxMi42MjkxNDU2LjE2Nzc3MjE2%22%2C%22app%22%3A%22siteforce%3AcommunityApp%22%2C%22loaded%22%3A%7B%22APPLICATION%40markup%3A%2F%2Fsiteforce%3AcommunityApp%22%3A%221305_7pTC6grCTP7M16KdvDQ-Xw%22%7D%2C%22dn%22%3A%5B%5D%2C%22globals%22%3A%7B%7D%2C%22uad%22%3Atrue%7D&"
-        "aura.pageURI=%2Fs%2Fmobilehomeparksearch&aura.token=null"
-    )
-
-    resp = requests.post(url, headers=_headers(), data=payload)
+    if not isinstance(data, dict):
+        return None
+    actions = data.get("actions")
+    if not isinstance(actions, list):
+        return None
+    for act in actions:
+        rv = act.get("returnValue") if isinstance(act, dict) else None
+        if not isinstance(rv, dict):
+            continue
+        inner = rv.get("returnValue")
+        if not isinstance(inner, dict):
+            inner = rv
+        if "queryResults" in inner:
+            return inner.get("queryResults")
+    return None
+
+
+def _parse(content: bytes, limit: int | None) -> Any:
     try:
-        data = resp.json()
+        data = json_loads(content)
     except Exception:
         return None
 
-    # Salesforce Aura responses are nested; extract queryResults if present
-    actions = data.get("actions", []) if isinstance(data, dict) else []
-    query_results = None
-    if actions:
-        try:
-            for act in actions:
-                rv = act.get("returnValue") if isinstance(act, dict) else None
-                if isinstance(rv, dict):
-                    # sometimes nested under 'returnValue' again
-                    inner = rv.get("returnValue") if isinstance(rv.get("returnValue"), dict) else rv
-                    if isinstance(inner, dict) and "queryResults" in inner:
-                        query_results = inner.get("queryResults")
-                        break
-        except Exception:
-            query_results = None
-
-    payload_to_return = query_results if query_results is not None else data
+    query_results = _extract_query_results(data)
+    if query_results is not None:
+        payload_to_return = query_results
+        # The response arrives (and is cached) as one buffered body, so a
+        # streaming parse buys nothing here; the real memory cost is
+        # keeping the whole Aura tree — context metadata and all — alive
+        # while the records get normalized. Drop it as soon as
+        # queryResults is extracted so only the records survive.
+        del data
+    else:
+        payload_to_return = data
+    if limit and isinstance(payload_to_return, list) and len(payload_to_return) > limit:
+        # Slice before normalize_keys so we never camelCase records the
+        # caller is going to throw away.
+        payload_to_return = payload_to_return[:limit]
     return normalize_keys(payload_to_return)
 
 
+async def _request(session: AsyncSession, payload: bytes, limit: int | None) -> Any:
+    content = http_cache.get("POST", _AURA_URL, payload, ttl=http_cache.LIST_TTL)
+    if content is None:
+        resp = await session.post(_AURA_URL, headers=_headers(), data=payload)
+        content = resp.content
+        # Never cache error bodies — a throttle page stored here would
+        # be served for the whole TTL
+        if resp.ok:
+            http_cache.put("POST", _AURA_URL, payload, content)
+    return _parse(content, limit)
+
+
+async def _fetch_one(session: AsyncSession, county_code: str, limit: int | None = None) -> Any:
+    return await _request(session, _build_payload(county_code), limit)
+
+
+def make_ca_hcd_fetcher(county_code: str, limit: int | None = None):
+    """Specialize a zero-argument fetcher for one county.
+
+    The request payload is built once at construction, so a fetcher that
+    runs repeatedly for the same county (dashboards, cron re-scrapes)
+    pays only the network and parse cost per call.
+    """
+    payload = _build_payload(county_code)
+
+    def run() -> Any:
+        async def _go() -> Any:
+            async with AsyncSession(impersonate="chrome124") as session:
+                return await _request(session, payload, limit)
+
+        return asyncio.run(_go())
+
+    return run
+
+
+def fetch_ca_hcd_many(county_codes: list[str], limit: int | None = None) -> list[Any]:
+    """Fetch several county codes concurrently over one AsyncSession.
+
+    Results come back in the order of `county_codes`. A Semaphore(8)
+    keeps the fan-out below Salesforce's throttling threshold.
+    """
+
+    async def _run() -> list[Any]:
+        sem = asyncio.Semaphore(8)
+        async with AsyncSession(impersonate="chrome124") as session:
+            async def bounded(code: str) -> Any:
+                async with sem:
+                    return await _fetch_one(session, code, limit)
+
+            return await asyncio.gather(*(bounded(c) for c in county_codes))
+
+    return asyncio.run(_run())
+
+
+def fetch_ca_hcd(county_code: str = "33", limit: int | None = None) -> Any:
+    """Fetch CA HCD Mobile Home Park search results for a county code.
+
+    Returns the parsed JSON (normalized keys) without saving to disk.
+    county_code "33" corresponds to Riverside County. When limit is set,
+    only the first `limit` results are normalized and returned.
+    """
+    return make_ca_hcd_fetcher(county_code, limit=limit)()
+
+
 if __name__ == "__main__":
     out = fetch_ca_hcd()
     size = len(out) if isinstance(out, list) else (1 if out else 0)
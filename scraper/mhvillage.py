@@ -12,27 +12,36 @@ import sys
 from typing import Any, List, Dict
 from urllib.parse import quote_plus
 
-from curl_cffi import requests
 from curl_cffi.requests import AsyncSession
 
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - optional speedup
+    uvloop = None
+else:
+    # Faster event loop for the detail fan-out; POSIX-only, so absence
+    # (e.g. on Windows) just means the default loop
+    uvloop.install()
+
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
-from lib.json_utils import normalize_keys  # noqa: E402
+from lib import http_cache  # noqa: E402
+from lib.json_utils import json_loads, normalize_keys  # noqa: E402
+
+
+# Built once; _headers() hands out the same dict because neither we nor
+# curl_cffi mutate it.
+# impersonate= on the session supplies the user-agent and sec-ch-ua
+# client hints consistently with the TLS fingerprint, so only the
+# request-specific headers remain here.
+_HEADERS = {
+    "Referer": "https://www.mhvillage.com/parks/ca/riverside-county",
+    "Accept": "application/json, text/plain, */*",
+    "Content-Type": "application/vnd.milli+json",
+}
 
 
 def _headers() -> dict:
-    return {
-        "sec-ch-ua-platform": '"Windows"',
-        "Referer": "https://www.mhvillage.com/parks/ca/riverside-county",
-        "User-Agent": (
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/139.0.0.0 "
-            "Safari/537.36 Edg/139.0.0.0"
-        ),
-        "Accept": "application/json, text/plain, */*",
-        "sec-ch-ua": '"Not;A=Brand";v="99", "Microsoft Edge";v="139", "Chromium";v="139"',
-        "Content-Type": "application/vnd.milli+json",
-        "sec-ch-ua-mobile": "?0",
-    }
+    return _HEADERS
 
 
 def _search_url(county: str, state: str, offset: int, limit: int) -> str:
@@ -52,66 +61,177 @@ DETAIL_INCLUDES = (
 )
 
 
+def _decode_detail(content: bytes) -> Any:
+    """Parse and key-normalize one detail body (runs on a worker thread)."""
+    return normalize_keys(json_loads(content))
+
+
+async def afetch_mhvillage_details(
+    county: str = "Riverside",
+    state: str = "CA",
+    limit: int = 50,
+    max_pages: int | None = None,
+    max_records: int | None = None,
+    concurrency: int = 64,
+) -> List[Dict[str, Any]]:
+    """Async variant of fetch_mhvillage_details; must be awaited.
+
+    Exposed so an orchestrator already inside an event loop can gather
+    this scraper alongside the others instead of serializing them.
+    """
+    headers = _headers()
+
+    # HTTP/2 multiplexes the in-flight streams over few connections,
+    # so a deep fan-out is cheap; max_clients gives curl room for it
+    async with AsyncSession(max_clients=100, impersonate="chrome124") as session:
+        # 1) Enumerate parks via search. Page 0 tells us the total, so
+        # every remaining page can be fetched concurrently instead of
+        # walking the offsets one round-trip at a time.
+        async def get_page(offset: int) -> dict | None:
+            url = _search_url(county, state, offset, limit)
+            content = http_cache.get("GET", url, ttl=http_cache.LIST_TTL)
+            if content is None:
+                # Revalidate an expired entry instead of re-downloading
+                stale = http_cache.get_stale("GET", url)
+                cond = http_cache.validators("GET", url) if stale is not None else {}
+                r = await session.get(url, headers={**headers, **cond} if cond else headers)
+                if r.status_code == 304 and stale is not None:
+                    content = stale
+                    http_cache.freshen("GET", url)
+                else:
+                    content = r.content
+                    # Never cache error bodies — a throttle page stored
+                    # here would be served for the whole TTL
+                    if r.ok:
+                        http_cache.put(
+                            "GET",
+                            url,
+                            content=content,
+                            etag=r.headers.get("etag"),
+                            last_modified=r.headers.get("last-modified"),
+                        )
+            try:
+                return json_loads(content)
+            except Exception:
+                return None
+
+        first = await get_page(0)
+        parks = first.get("payload") if isinstance(first, dict) else None
+        if not isinstance(parks, list) or not parks:
+            return []
+        all_parks = list(parks)
+
+        total = int(first.get("total") or 0)
+        # The search API stops serving past offset 5000
+        offsets = list(range(limit, min(total, 5000 + limit), limit))
+        if max_pages:
+            offsets = offsets[: max(0, max_pages - 1)]
+        if max_records:
+            offsets = offsets[: max(0, -(-max_records // limit) - 1)]
+        if offsets:
+            pages = await asyncio.gather(*(get_page(off) for off in offsets))
+            for page in pages:
+                more = page.get("payload") if isinstance(page, dict) else None
+                if isinstance(more, list):
+                    all_parks.extend(more)
+
+        # Hard caps before the detail fan-out: the page math above keeps
+        # the fetch count right, but the last page can overshoot
+        if max_records:
+            all_parks = all_parks[:max_records]
+        if max_pages:
+            all_parks = all_parks[: max_pages * limit]
+        park_keys = [p.get("key") for p in all_parks if isinstance(p, dict) and p.get("key")]
+        if not park_keys:
+            return []
+
+        # 2) Fetch details concurrently over the same session. The
+        # semaphore gates only the request await — cache checks and
+        # decode run outside it so a slot is never held for CPU work.
+        # (curl_cffi resolves a request as one awaitable, so send and
+        # body download can't be gated separately.) Bounded so a
+        # release bug surfaces instead of silently widening the limit.
+        sem = asyncio.BoundedSemaphore(max(1, concurrency))
+        loop = asyncio.get_running_loop()
+
+        async def fetch_one(k: int):
+            durl = f"https://www.mhvillage.com/api/v1/parks/{k}.json?{DETAIL_INCLUDES}"
+            try:
+                content = http_cache.get("GET", durl, ttl=http_cache.DETAIL_TTL)
+                if content is None:
+                    stale = http_cache.get_stale("GET", durl)
+                    cond = http_cache.validators("GET", durl) if stale is not None else {}
+                    hdrs = {**headers, **cond} if cond else headers
+                    async with sem:
+                        # Back off briefly if the deep fan-out trips
+                        # the server's rate limiting
+                        for attempt in range(3):
+                            r = await session.get(durl, headers=hdrs)
+                            if r.status_code not in (429, 503):
+                                break
+                            await asyncio.sleep(0.5 * 2 ** attempt)
+                    if r.status_code == 304 and stale is not None:
+                        content = stale
+                        http_cache.freshen("GET", durl)
+                    else:
+                        content = r.content
+                        # The retry loop can exhaust its attempts and
+                        # exit on a 429/503; never cache that (or any
+                        # other error body), or a transient throttle
+                        # would be replayed for the whole DETAIL_TTL
+                        if r.ok:
+                            http_cache.put(
+                                "GET",
+                                durl,
+                                content=content,
+                                etag=r.headers.get("etag"),
+                                last_modified=r.headers.get("last-modified"),
+                            )
+                try:
+                    # Parse + normalize on a worker thread so the
+                    # event loop keeps draining in-flight responses
+                    # during the CPU pass
+                    return await loop.run_in_executor(None, _decode_detail, content)
+                except Exception:
+                    return {"error": True, "key": k, "raw": content.decode(errors="replace")}
+            except Exception as e:
+                return {"error": True, "key": k, "message": str(e)}
+
+        return await asyncio.gather(*(fetch_one(k) for k in park_keys))
+
+
 def fetch_mhvillage_details(
     county: str = "Riverside",
     state: str = "CA",
     limit: int = 50,
     max_pages: int | None = None,
+    max_records: int | None = None,
+    concurrency: int = 64,
 ) -> List[Dict[str, Any]]:
     """Fetch MHVillage park details for a county/state and return a list of dicts.
 
     - Paginates search endpoint to get park keys.
     - Fetches park detail for each key concurrently.
     - Returns camelCased keys via normalize_keys.
-    """
-    headers = _headers()
 
-    # 1) Enumerate parks via search
-    offset = 0
-    all_parks: list[dict] = []
-    pages = 0
-    while True:
-        url = _search_url(county, state, offset, limit)
-        resp = requests.get(url, headers=headers)
-        try:
-            search = resp.json()
-        except Exception:
-            break
-
-        parks = search.get("payload") or []
-        if not isinstance(parks, list) or not parks:
-            break
-        all_parks.extend(parks)
-
-        total = int(search.get("total") or 0)
-        offset += limit
-        pages += 1
-        if (total and offset >= total) or (max_pages and pages >= max_pages) or offset > 5000:
-            break
-
-    park_keys = [p.get("key") for p in all_parks if isinstance(p, dict) and p.get("key")]
-
-    # 2) Fetch details concurrently
-    async def _fetch_all(keys: list[int]) -> list[dict]:
-        sem = asyncio.Semaphore(10)
-        async with AsyncSession() as session:
-            async def fetch_one(k: int):
-                durl = f"https://www.mhvillage.com/api/v1/parks/{k}.json?{DETAIL_INCLUDES}"
-                try:
-                    async with sem:
-                        r = await session.get(durl, headers=headers)
-                    try:
-                        return r.json()
-                    except Exception:
-                        return {"error": True, "key": k, "raw": r.text}
-                except Exception as e:
-                    return {"error": True, "key": k, "message": str(e)}
-
-            tasks = [fetch_one(k) for k in keys]
-            return await asyncio.gather(*tasks)
-
-    details = asyncio.run(_fetch_all(park_keys)) if park_keys else []
-    return normalize_keys(details)
+    `limit` is the search page size; `max_records` caps the total number
+    of parks enumerated, so pagination (and the per-park detail fetches)
+    stop as soon as enough results are in hand. `concurrency` bounds how
+    many detail requests are in flight at once. One AsyncSession spans
+    search and details, so every request after the first rides the same
+    warm connection. Callers already inside an event loop should await
+    afetch_mhvillage_details instead.
+    """
+    return asyncio.run(
+        afetch_mhvillage_details(
+            county=county,
+            state=state,
+            limit=limit,
+            max_pages=max_pages,
+            max_records=max_records,
+            concurrency=concurrency,
+        )
+    )
 
 
 if __name__ == "__main__":
@@ -10,88 +10,145 @@ import asyncio
 import os
 import sys
 from typing import Any, List
+from urllib.parse import quote
 
-from curl_cffi import requests
 from curl_cffi.requests import AsyncSession
 
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - optional speedup
+    uvloop = None
+else:
+    # Faster event loop for the detail fan-out; POSIX-only, so absence
+    # (e.g. on Windows) just means the default loop
+    uvloop.install()
+
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
-from lib.json_utils import normalize_keys  # noqa: E402
+from lib import http_cache  # noqa: E402
+from lib.json_utils import json_loads, normalize_keys  # noqa: E402
 
 
 BASE_URL = "https://rivcoview.rivcoacr.org/data/ajaxcalls/db/getData.php"
 
+# Constant payload halves pre-encoded as bytes; building a request body
+# is then prefix + quoted value, with nothing left for curl_cffi to
+# re-encode.
+_SEARCH_PREFIX = b"qtype=assessment_info&field=mv_Location%3Astreet_address&value="
+_PIN_PREFIX = b"qtype=assessment_info&field=mv_Location%3APIN&value="
+
+
+# Built once; _headers() hands out the same dict because neither we nor
+# curl_cffi mutate it. impersonate= on the session supplies the
+# user-agent and sec-ch-ua client hints consistently with the TLS
+# fingerprint, so only the request-specific headers remain here.
+_HEADERS = {
+    'accept': 'application/json, text/javascript, */*; q=0.01',
+    'accept-language': 'en-US,en;q=0.9',
+    'cache-control': 'no-cache',
+    'content-type': 'application/x-www-form-urlencoded; charset=UTF-8',
+    'origin': 'https://rivcoview.rivcoacr.org',
+    'pragma': 'no-cache',
+    'priority': 'u=1, i',
+    'referer': 'https://rivcoview.rivcoacr.org/?utm_source=chatgpt.com',
+    'sec-fetch-dest': 'empty',
+    'sec-fetch-mode': 'cors',
+    'sec-fetch-site': 'same-origin',
+    'x-requested-with': 'XMLHttpRequest',
+    'Cookie': 'surveym_link=1'
+}
+
 
 def _headers() -> dict:
-    return {
-        'accept': 'application/json, text/javascript, */*; q=0.01',
-        'accept-language': 'en-US,en;q=0.9',
-        'cache-control': 'no-cache',
-        'content-type': 'application/x-www-form-urlencoded; charset=UTF-8',
-        'origin': 'https://rivcoview.rivcoacr.org',
-        'pragma': 'no-cache',
-        'priority': 'u=1, i',
-        'referer': 'https://rivcoview.rivcoacr.org/?utm_source=chatgpt.com',
-        'sec-ch-ua': '"Not;A=Brand";v="99", "Microsoft Edge";v="139", "Chromium";v="139"',
-        'sec-ch-ua-mobile': '?0',
-        'sec-ch-ua-platform': '"Windows"',
-        'sec-fetch-dest': 'empty',
-        'sec-fetch-mode': 'cors',
-        'sec-fetch-site': 'same-origin',
-        'user-agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/139.0.0.0 Safari/537.36 Edg/139.0.0.0',
-        'x-requested-with': 'XMLHttpRequest',
-        'Cookie': 'surveym_link=1'
-    }
-
-
-def fetch_rivcoview(query_value: str = "Riverside", limit_rows: int | None = 200) -> List[Any]:
-    """Fetch RivCoView detailed records for parcels matching street_address value.
+    return _HEADERS
 
-    Returns a list of normalized detail records (list or dict items as returned by API).
-    """
-    search_payload = f"qtype=assessment_info&field=mv_Location%3Astreet_address&value={query_value}"
-    resp = requests.post(BASE_URL, headers=_headers(), data=search_payload)
-    try:
-        search_data = resp.json()
-    except Exception:
-        import json as _json
-        search_data = _json.loads(resp.text)
-
-    rows = search_data.get("rows") if isinstance(search_data, dict) else None
-    if not rows or not isinstance(rows, list):
-        return []
-
-    apns = [r.get("apn") for r in rows if isinstance(r, dict) and r.get("apn")]
-    if not apns:
-        return []
-
-    city_by_apn = {r.get("apn"): r.get("situs_city") for r in rows if isinstance(r, dict) and r.get("apn")}
-
-    detail_headers = _headers()
-
-    async def fetch_all_details(pin_values: list[str]) -> list:
-        sem = asyncio.Semaphore(10)
-        async with AsyncSession() as session:
-            async def fetch_one(pin: str):
-                pin_payload = f"qtype=assessment_info&field=mv_Location%3APIN&value={pin}"
-                try:
-                    async with sem:
-                        r = await session.post(BASE_URL, headers=detail_headers, data=pin_payload)
-                    try:
-                        return r.json()
-                    except Exception:
-                        return {"error": True, "pin": pin, "raw": r.text}
-                except Exception as e:
-                    return {"error": True, "pin": pin, "message": str(e)}
 
-            tasks = [fetch_one(p) for p in pin_values]
-            return await asyncio.gather(*tasks)
+def _decode_detail(content: bytes) -> Any:
+    """Parse and key-normalize one detail body (runs on a worker thread)."""
+    return normalize_keys(json_loads(content))
+
 
-    details = asyncio.run(fetch_all_details(apns))
+async def afetch_rivcoview(
+    query_value: str = "Riverside",
+    limit_rows: int | None = 200,
+) -> List[Any]:
+    """Async variant of fetch_rivcoview; must be awaited.
 
-    # Enrich with city
-    for idx, apn in enumerate(apns):
+    Exposed so an orchestrator already inside an event loop can gather
+    this scraper alongside the others instead of serializing them.
+    """
+    headers = _headers()
+
+    async with AsyncSession(impersonate="chrome124") as session:
+        search_payload = _SEARCH_PREFIX + quote(str(query_value), safe="").encode()
+        content = http_cache.get("POST", BASE_URL, search_payload, ttl=http_cache.LIST_TTL)
+        if content is None:
+            resp = await session.post(
+                BASE_URL, headers=headers, data=search_payload, timeout=15
+            )
+            content = resp.content
+            # Never cache error bodies — a throttle page stored here
+            # would be served for the whole TTL
+            if resp.ok:
+                http_cache.put("POST", BASE_URL, search_payload, content)
         try:
-            rec = details[idx]
+            search_data = json_loads(content)
+        except Exception:
+            return []
+
+        rows = search_data.get("rows") if isinstance(search_data, dict) else None
+        if not rows or not isinstance(rows, list):
+            return []
+
+        apns = [r.get("apn") for r in rows if isinstance(r, dict) and r.get("apn")]
+        if not apns:
+            return []
+        # Cap the fan-out before it happens; anything past the limit
+        # would be fetched only to be thrown away (0/None = unlimited)
+        if limit_rows and len(apns) > limit_rows:
+            apns = apns[:limit_rows]
+
+        city_by_apn = {
+            r.get("apn"): r.get("situs_city")
+            for r in rows
+            if isinstance(r, dict) and r.get("apn")
+        }
+
+        # Gates only the request await; cache checks and decode run
+        # outside so a slot is never held for CPU work
+        sem = asyncio.BoundedSemaphore(10)
+        loop = asyncio.get_running_loop()
+
+        async def fetch_one(pin: str):
+            pin_payload = _PIN_PREFIX + quote(str(pin), safe="").encode()
+            try:
+                content = http_cache.get("POST", BASE_URL, pin_payload, ttl=http_cache.DETAIL_TTL)
+                if content is None:
+                    async with sem:
+                        r = await session.post(
+                            BASE_URL, headers=headers, data=pin_payload, timeout=15
+                        )
+                    content = r.content
+                    if r.ok:
+                        http_cache.put("POST", BASE_URL, pin_payload, content)
+                try:
+                    # Parse + normalize on a worker thread so the
+                    # event loop keeps draining in-flight responses
+                    # during the CPU pass
+                    return await loop.run_in_executor(None, _decode_detail, content)
+                except Exception:
+                    return {"error": True, "pin": pin, "raw": content.decode(errors="replace")}
+            except Exception as e:
+                return {"error": True, "pin": pin, "message": str(e)}
+
+        # Several search rows can share a parcel; fetch each APN once
+        # and fan the result back out to keep one detail per row
+        unique_apns = list(dict.fromkeys(apns))
+        fetched = await asyncio.gather(*(fetch_one(p) for p in unique_apns))
+        by_apn = dict(zip(unique_apns, fetched))
+        details = [by_apn[p] for p in apns]
+
+        # Enrich with city
+        for apn, rec in zip(apns, details):
             city = city_by_apn.get(apn)
             if not city:
                 continue
@@ -101,7 +158,20 @@ def fetch_rivcoview(query_value: str = "Riverside", limit_rows: int | None = 200
                 for item in rec:
                     if isinstance(item, dict):
                         item.setdefault("city", city)
-        except Exception:
-            pass
 
-    return normalize_keys(details)
\ No newline at end of file
+        return details
+
+
+def fetch_rivcoview(
+    query_value: str = "Riverside",
+    limit_rows: int | None = 200,
+) -> List[Any]:
+    """Fetch RivCoView detailed records for parcels matching street_address value.
+
+    Returns a list of normalized detail records (list or dict items as returned by API).
+    `limit_rows` caps how many parcels get a detail fetch (0/None means
+    all). The search POST and every detail POST share one AsyncSession,
+    so the TLS handshake is paid once for the whole run. Callers already
+    inside an event loop should await afetch_rivcoview instead.
+    """
+    return asyncio.run(afetch_rivcoview(query_value=query_value, limit_rows=limit_rows))
\ No newline at end of file